@@ -14,7 +14,7 @@ from typing import Union
 import numpy as np
 from sklearn.metrics._scorer import _BaseScorer
 
-__all__ = ['get_gain', 'get_scorer_name', 'averaging_mechanism']
+__all__ = ['get_gain', 'get_gains', 'get_scorer_name', 'averaging_mechanism']
 
 from deepchecks.core.errors import DeepchecksValueError
 
@@ -37,6 +37,18 @@ def get_gain(base_score, score, perfect_score, max_gain):
     return ratio
 
 
+def get_gains(base_scores: np.ndarray, scores: np.ndarray, perfect_scores: np.ndarray, max_gain: float) -> np.ndarray:
+    """Get the gains of arrays of base scores and scores, element-wise as computed by `get_gain`."""
+    base_scores = np.asarray(base_scores, dtype=float)
+    distance_from_perfect = np.asarray(perfect_scores, dtype=float) - base_scores
+    scores_diff = np.asarray(scores, dtype=float) - base_scores
+    ratio = np.divide(scores_diff, distance_from_perfect,
+                      out=np.zeros_like(scores_diff), where=distance_from_perfect != 0)
+    # If both base score and score are perfect the gain is 0, else base_score is better than score
+    ratio = np.where((distance_from_perfect == 0) & (scores_diff != 0), -max_gain, ratio)
+    return np.clip(ratio, -max_gain, max_gain)
+
+
 def get_scorer_name(scorer) -> str:
     """Get scorer name from a scorer."""
     if isinstance(scorer, str):
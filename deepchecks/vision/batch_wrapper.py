@@ -55,10 +55,19 @@ class Batch:
             self._labels = dataset.batch_to_labels(self._batch)
         return self._labels
 
+    def _get_dataset_indexes(self) -> List[int]:
+        """Return the indices in the dataset of the batch samples."""
+        # The data loaders of VisionData always use IndicesSequentialSampler, so the batch indices are a slice of the
+        # sampler indices, without the need to iterate the batch sampler up to this batch
+        dataset = self._context.get_data_by_kind(self._dataset_kind)
+        batch_sampler = dataset.data_loader.batch_sampler
+        start = self.batch_index * batch_sampler.batch_size
+        return batch_sampler.sampler[start:start + batch_sampler.batch_size]
+
     def _do_static_pred(self):
         preds = self._context.static_predictions[self._dataset_kind]
         dataset = self._context.get_data_by_kind(self._dataset_kind)
-        indexes = list(dataset.data_loader.batch_sampler)[self.batch_index]
+        indexes = self._get_dataset_indexes()
         preds = itemgetter(*indexes)(preds)
         if dataset.task_type == TaskType.CLASSIFICATION:
             return torch.stack(preds)
@@ -95,14 +104,12 @@ class Batch:
 
     def __len__(self):
         """Return length of batch."""
-        dataset = self._context.get_data_by_kind(self._dataset_kind)
-        return len(list(dataset.data_loader.batch_sampler)[self.batch_index])
+        return len(self._get_dataset_indexes())
 
     def _do_static_prop(self):
         """Get a batch of static properties and transform it to the cache format."""
         props = self._context.static_properties[self._dataset_kind]
-        dataset = self._context.get_data_by_kind(self._dataset_kind)
-        indexes = list(dataset.data_loader.batch_sampler)[self.batch_index]
+        indexes = self._get_dataset_indexes()
         index_to_prop = {index: props[index] for index in indexes}
         props_to_cache = static_prop_to_cache_format(index_to_prop)
         return props_to_cache
@@ -117,7 +117,8 @@ class ClassPerformance(TrainTestCheck):
                 {k: m.compute() for k, m in self._data_metrics[dataset_kind].items()}, dataset
             )
             metrics_df['Dataset'] = dataset_kind.value
-            metrics_df['Number of samples'] = metrics_df['Class'].map(dataset.n_of_samples_per_class.get)
+            samples_per_class = dataset._samples_per_class_view  # pylint: disable=protected-access
+            metrics_df['Number of samples'] = metrics_df['Class'].map(samples_per_class.get)
             results.append(metrics_df)
 
         results_df = pd.concat(results)
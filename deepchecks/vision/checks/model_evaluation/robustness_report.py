@@ -212,6 +212,7 @@ class RobustnessReport(SingleDatasetCheck):
             return (a - b) / b if b != 0 else 0
 
         aug_top_affected = defaultdict(list)
+        samples_per_class = dataset._samples_per_class_view  # pylint: disable=protected-access
         metrics = base_results['Metric'].unique().tolist()
         for metric in metrics:
             single_metric_scores = augmented_results[augmented_results['Metric'] == metric][['Class', 'Value']] \
@@ -224,7 +225,7 @@ class RobustnessReport(SingleDatasetCheck):
                 aug_top_affected[metric].append({'class': index_class,
                                                  'value': single_metric_scores.at[index_class, 'Value'],
                                                  'diff': diff_value,
-                                                 'samples': dataset.n_of_samples_per_class.get(index_class, 0)})
+                                                 'samples': samples_per_class.get(index_class, 0)})
         return aug_top_affected
 
     def _calc_performance_diff(self, mean_base, augmented_metrics):
@@ -21,7 +21,7 @@ from ignite.metrics import Fbeta, Metric
 from deepchecks.core import CheckResult, ConditionCategory, ConditionResult, DatasetKind
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils import plot
-from deepchecks.utils.metrics import get_gain
+from deepchecks.utils.metrics import get_gains
 from deepchecks.utils.strings import format_percent
 from deepchecks.vision import Batch, Context, TrainTestCheck
 from deepchecks.vision.metrics_utils import get_scorers_dict, metric_results_to_df
@@ -120,6 +120,9 @@ class SimpleModelComparison(TrainTestCheck):
         self.metric_to_show_by = metric_to_show_by
         self._test_metrics = None
         self._perfect_metrics = None
+        self._simple_metrics = None
+        self._eye = None
+        self._rng = None
 
     def initialize_run(self, context: Context):
         """Initialize the metrics for the check, and validate task type is relevant."""
@@ -127,10 +130,15 @@ class SimpleModelComparison(TrainTestCheck):
 
         if self.alternative_metrics is None:
             self._test_metrics = {'F1': Fbeta(beta=1, average=False)}
-            self._perfect_metrics = {'F1': Fbeta(beta=1, average=False)}
+            # The F1 of a perfect model is 1 for every class, so there is no need to score it
+            self._perfect_metrics = None
+            self._simple_metrics = {'F1': Fbeta(beta=1, average=False)}
         else:
             self._test_metrics = get_scorers_dict(context.train, self.alternative_metrics)
             self._perfect_metrics = get_scorers_dict(context.train, self.alternative_metrics)
+            self._simple_metrics = get_scorers_dict(context.train, self.alternative_metrics)
+        self._eye = None
+        self._rng = np.random.default_rng(context.random_state)
 
     def update(self, context: Context, batch: Batch, dataset_kind: DatasetKind):
         """Update the metrics for the check."""
@@ -140,58 +148,44 @@ class SimpleModelComparison(TrainTestCheck):
             for _, metric in self._test_metrics.items():
                 metric.update((prediction, label))
 
-            # calculating perfect scores
-            n_of_classes = batch.predictions.cpu().detach().shape[1]
-            perfect_predictions = np.eye(n_of_classes)[label.cpu().detach().numpy()]
+            if self._perfect_metrics is None:
+                return
+
+            # calculating perfect scores, the identity matrix is built once and gathered by the labels
+            if self._eye is None:
+                self._eye = torch.eye(prediction.shape[1], dtype=torch.float32, device=context.device)
+            perfect_predictions = self._eye[label.long().to(self._eye.device)]
             for _, metric in self._perfect_metrics.items():
-                metric.update((torch.Tensor(perfect_predictions).to(context.device), label))
+                metric.update((perfect_predictions, label))
 
     def compute(self, context: Context) -> CheckResult:
         """Compute the metrics for the check."""
-        results = []
-
-        metrics_to_eval = {
-            'Given Model': self._test_metrics,
-            'Perfect Model': self._perfect_metrics,
-            'Simple Model': self._generate_simple_model_metrics(context.train, context.test)
-        }
-        for name, metrics in metrics_to_eval.items():
-            dataset = context.get_data_by_kind(DatasetKind.TEST)
-            metrics_df = metric_results_to_df(
-                {k: m.compute() for k, m in metrics.items()}, dataset
-            )
-            metrics_df['Model'] = name
-            metrics_df['Number of samples'] = metrics_df['Class'].map(dataset.n_of_samples_per_class.get)
-            results.append(metrics_df)
-
-        results_df = pd.concat(results)
-        results_df = results_df[['Model', 'Metric', 'Class', 'Class Name', 'Number of samples', 'Value']]
-
-        results_df.dropna(inplace=True)
-        results_df.sort_values(by=['Model', 'Value'], ascending=False, inplace=True)
-        results_df.reset_index(drop=True, inplace=True)
+        results_df = self._build_results_df(context)
 
         if context.with_display:
             if not self.metric_to_show_by:
                 self.metric_to_show_by = list(self._test_metrics.keys())[0]
+            # The perfect model is not displayed, so filter it out once for both the classes selection and the plot
+            non_perfect_df = results_df.loc[results_df['Model'] != 'Perfect Model']
+            non_perfect_df = non_perfect_df.assign(Model=non_perfect_df['Model'].cat.remove_unused_categories())
             if self.class_list_to_show is not None:
-                display_df = results_df.loc[results_df['Class'].isin(self.class_list_to_show)]
+                display_df = non_perfect_df.loc[non_perfect_df['Class'].isin(self.class_list_to_show)]
             elif self.n_to_show is not None:
-                rows = results_df['Class'].isin(filter_classes_for_display(
-                    results_df.loc[results_df['Model'] != 'Perfect Model'],
+                rows = non_perfect_df['Class'].isin(filter_classes_for_display(
+                    non_perfect_df,
                     self.metric_to_show_by,
                     self.n_to_show,
                     self.show_only,
                     column_to_filter_by='Model',
                     column_filter_value='Given Model'
                 ))
-                display_df = results_df.loc[rows]
+                display_df = non_perfect_df.loc[rows]
             else:
-                display_df = results_df
+                display_df = non_perfect_df
 
             fig = (
                 px.histogram(
-                    display_df.loc[results_df['Model'] != 'Perfect Model'],
+                    display_df,
                     x='Class Name',
                     y='Value',
                     color='Model',
@@ -215,45 +209,80 @@ class SimpleModelComparison(TrainTestCheck):
             display=fig
         )
 
+    def _build_results_df(self, context: Context) -> pd.DataFrame:
+        """Build the scores dataframe of the given, perfect and simple models over the test dataset."""
+        results = {}
+        dataset = context.get_data_by_kind(DatasetKind.TEST)
+        samples_per_class = dataset._samples_per_class_view  # pylint: disable=protected-access
+        models = ['Given Model', 'Perfect Model', 'Simple Model']
+
+        metrics_to_eval = {
+            'Given Model': self._test_metrics,
+            'Simple Model': self._generate_simple_model_metrics(context.train, context.test)
+        }
+        if self._perfect_metrics is not None:
+            metrics_to_eval['Perfect Model'] = self._perfect_metrics
+        for name, metrics in metrics_to_eval.items():
+            metrics_df = metric_results_to_df({k: m.compute() for k, m in metrics.items()}, dataset)
+            metrics_df['Model'] = name
+            results[name] = metrics_df
+        if 'Perfect Model' not in results:
+            results['Perfect Model'] = results['Given Model'].assign(Model='Perfect Model',
+                                                                     Value=_perfect_f1_score())
+
+        results_df = pd.concat([results[name] for name in models], ignore_index=True)
+        results_df['Number of samples'] = results_df['Class'].map(samples_per_class.get)
+        # Categorical columns make the filters and the sort by model compare integer codes instead of strings
+        results_df['Model'] = pd.Categorical(results_df['Model'], categories=models)
+        results_df['Metric'] = pd.Categorical(results_df['Metric'], categories=list(self._test_metrics.keys()))
+        results_df = results_df[['Model', 'Metric', 'Class', 'Class Name', 'Number of samples', 'Value']]
+
+        results_df.dropna(inplace=True)
+        results_df.sort_values(by=['Model', 'Value'], ascending=False, inplace=True)
+        results_df.reset_index(drop=True, inplace=True)
+        return results_df
+
     def _generate_simple_model_metrics(self, train, test):
+        train_samples_per_class = train._samples_per_class_view  # pylint: disable=protected-access
         class_prior = np.zeros(train.num_classes)
-        n_samples = 0
-        for label, total in train.n_of_samples_per_class.items():
-            class_prior[label] = total
-            n_samples += total
-        class_prior /= n_samples
+        class_prior[np.fromiter(train_samples_per_class.keys(), dtype=np.int64, count=len(train_samples_per_class))] = \
+            np.fromiter(train_samples_per_class.values(), dtype=np.float64, count=len(train_samples_per_class))
+        class_prior /= class_prior.sum()
 
+        test_samples_per_class = test._samples_per_class_view  # pylint: disable=protected-access
+        n_test_samples = sum(test_samples_per_class.values())
+
+        # Create dummy predictions - the constant strategies share a single row, so it is broadcast to all samples
         if self.strategy == 'most_frequent':
             dummy_prediction = np.zeros(train.num_classes)
             dummy_prediction[np.argmax(class_prior)] = 1
-            dummy_predictor = lambda: torch.from_numpy(dummy_prediction)
         elif self.strategy == 'prior':
-            dummy_predictor = lambda: torch.from_numpy(class_prior)
+            dummy_prediction = class_prior
         elif self.strategy == 'stratified':
-            dummy_predictor = lambda: torch.from_numpy(np.random.multinomial(1, class_prior))
+            # A one-hot vector is sampled for each sample, so there is no shared row
+            dummy_prediction = None
         elif self.strategy == 'uniform':
-            dummy_predictor = lambda: torch.from_numpy(np.ones(train.num_classes) / train.num_classes)
+            dummy_prediction = np.ones(train.num_classes) / train.num_classes
         else:
             raise DeepchecksValueError(
                 f'Unknown strategy type: {self.strategy}, expected one of {_allowed_strategies}.'
             )
 
-        # Create dummy predictions
-        dummy_predictions = []
-        labels = []
-        for label, count in test.n_of_samples_per_class.items():
-            labels += [label] * count
-            for _ in range(count):
-                dummy_predictions.append(dummy_predictor())
-
-        # Get scorers
-        if self.alternative_metrics is None:
-            metrics = {'F1': Fbeta(beta=1, average=False)}
+        if dummy_prediction is None:
+            dummy_predictions = torch.from_numpy(
+                self._rng.multinomial(1, class_prior, size=n_test_samples).astype(class_prior.dtype)
+            )
         else:
-            metrics = get_scorers_dict(train, self.alternative_metrics)
-        for _, metric in metrics.items():
-            metric.update((torch.stack(dummy_predictions), torch.LongTensor(labels)))
-        return metrics
+            dummy_predictions = torch.from_numpy(dummy_prediction).expand(n_test_samples, -1)
+
+        labels = torch.from_numpy(np.repeat(
+            np.fromiter(test_samples_per_class.keys(), dtype=np.int64, count=len(test_samples_per_class)),
+            np.fromiter(test_samples_per_class.values(), dtype=np.int64, count=len(test_samples_per_class))
+        ))
+
+        for _, metric in self._simple_metrics.items():
+            metric.update((dummy_predictions, labels))
+        return self._simple_metrics
 
     def add_condition_gain_greater_than(self,
                                         min_allowed_gain: float = 0.1,
@@ -306,42 +335,50 @@ def calculate_condition_logic(result, include_classes=None, average=False, max_g
 
     fails = {}
     if not average:
+        if include_classes:
+            scores = scores.loc[scores['Class'].isin(include_classes)]
+        # Join the perfect and simple scores of each (metric, class) once, instead of looking them up per row
+        joined = scores[['Metric', 'Class', 'Class Name', 'Value']] \
+            .merge(perfect_scores[['Metric', 'Class', 'Value']].rename(columns={'Value': 'Perfect'}),
+                   on=['Metric', 'Class'], how='left') \
+            .merge(simple_scores[['Metric', 'Class', 'Value']].rename(columns={'Value': 'Simple'}),
+                   on=['Metric', 'Class'], how='left')
+        # If origin model is perfect, skip the gain calculation
+        joined = joined.loc[joined['Value'] != joined['Perfect']]
+        joined = joined.assign(Gain=get_gains(joined['Simple'].to_numpy(dtype=float),
+                                              joined['Value'].to_numpy(dtype=float),
+                                              joined['Perfect'].to_numpy(dtype=float),
+                                              max_gain))
+
+        gains_per_metric = dict(tuple(joined.groupby('Metric', sort=False, observed=True)))
         for metric in metrics:
-            failed_classes = {}
-            for _, scores_row in scores.loc[scores['Metric'] == metric].iterrows():
-                curr_class = scores_row['Class']
-                curr_class_name = scores_row['Class Name']
-                curr_value = scores_row['Value']
-                if include_classes and curr_class not in include_classes:
-                    continue
-                perfect = perfect_scores.loc[(perfect_scores['Metric'] == metric) &
-                                             (perfect_scores['Class'] == curr_class)]['Value'].values[0]
-                if curr_value == perfect:
-                    continue
-
-                simple_score_value = simple_scores.loc[(simple_scores['Class'] == curr_class) &
-                                                       (simple_scores['Metric'] == metric)]['Value'].values[0]
-                gain = get_gain(simple_score_value,
-                                curr_value,
-                                perfect,
-                                max_gain)
-                update_min_gain(gain, metric, curr_class_name)
-                if gain <= min_allowed_gain:
-                    failed_classes[curr_class_name] = format_percent(gain)
-
-            if failed_classes:
-                fails[metric] = failed_classes
-    else:
-        scores = average_scores(scores, simple_scores, include_classes)
-        for metric, models_scores in scores.items():
-            metric_perfect_score = perfect_scores.loc[(perfect_scores['Metric'] == metric)]['Value'].values[0]
-            # If origin model is perfect, skip the gain calculation
-            if models_scores['Origin'] == metric_perfect_score:
+            if metric not in gains_per_metric:
                 continue
-            gain = get_gain(models_scores['Simple'],
-                            models_scores['Origin'],
-                            metric_perfect_score,
-                            max_gain)
+            metric_gains = gains_per_metric[metric]
+            min_row = metric_gains.iloc[metric_gains['Gain'].to_numpy().argmin()]
+            update_min_gain(min_row['Gain'], metric, min_row['Class Name'])
+            failed = metric_gains.loc[metric_gains['Gain'] <= min_allowed_gain]
+            if not failed.empty:
+                fails[metric] = dict(zip(failed['Class Name'], failed['Gain'].map(format_percent)))
+    else:
+        if include_classes:
+            averages = pd.DataFrame.from_dict(average_scores(scores, simple_scores, include_classes),
+                                              orient='index', columns=['Origin', 'Simple'])
+        else:
+            # Without classes filter all classes are averaged, so there is no need to match them between the models
+            averages = pd.DataFrame({
+                'Origin': scores.groupby('Metric', sort=False, observed=True)['Value'].mean(),
+                'Simple': simple_scores.groupby('Metric', sort=False, observed=True)['Value'].mean()
+            }).reindex(metrics)
+        perfect = perfect_scores.groupby('Metric', sort=False, observed=True)['Value'].first().reindex(averages.index)
+        # If origin model is perfect, skip the gain calculation
+        not_perfect = (averages['Origin'] != perfect).to_numpy()
+        averages, perfect = averages.loc[not_perfect], perfect.loc[not_perfect]
+        gains = get_gains(averages['Simple'].to_numpy(dtype=float),
+                          averages['Origin'].to_numpy(dtype=float),
+                          perfect.to_numpy(dtype=float),
+                          max_gain)
+        for metric, gain in zip(averages.index, gains):
             update_min_gain(gain, metric)
             if gain <= min_allowed_gain:
                 fails[metric] = format_percent(gain)
@@ -372,23 +409,23 @@ def average_scores(scores, simple_model_scores, include_classes):
         the average scores for each metric. The keys are the metric names, and the values are a dictionary
         with the keys being Origin and Simple and the values being the average score.
     """
-    result = {}
     metrics = scores['Metric'].unique()
-    for metric in metrics:
-        model_score = 0
-        simple_score = 0
-        total = 0
-        for _, row in scores.loc[scores['Metric'] == metric].iterrows():
-            if include_classes and row['Class'] not in include_classes:
-                continue
-            model_score += row['Value']
-            simple_score += simple_model_scores.loc[(simple_model_scores['Class'] == row['Class']) &
-                                                    (simple_model_scores['Metric'] == metric)]['Value'].values[0]
-            total += 1
-
-        result[metric] = {
-            'Origin': model_score / total,
-            'Simple': simple_score / total
-         }
-
-    return result
+    if include_classes:
+        scores = scores.loc[scores['Class'].isin(include_classes)]
+    # Average the simple model scores over the same classes as the given model
+    joined = scores[['Metric', 'Class', 'Value']].rename(columns={'Value': 'Origin'}) \
+        .merge(simple_model_scores[['Metric', 'Class', 'Value']].rename(columns={'Value': 'Simple'}),
+               on=['Metric', 'Class'], how='left')
+    means = joined.groupby('Metric', sort=False, observed=True)[['Origin', 'Simple']].mean()
+
+    return {
+        metric: {'Origin': means.at[metric, 'Origin'], 'Simple': means.at[metric, 'Simple']}
+        for metric in metrics if metric in means.index
+    }
+
+
+def _perfect_f1_score() -> float:
+    """Return the per-class F1 of a perfect model, as computed by the default F1 scorer (including its epsilon)."""
+    metric = Fbeta(beta=1, average=False)
+    metric.update((torch.eye(2), torch.arange(2)))
+    return metric.compute()[0].item()
@@ -102,14 +102,15 @@ class NewLabels(TrainTestCheck, ReduceLabelMixin):
         test_data = context.get_data_by_kind(DatasetKind.TEST)
 
         classes_in_train = context.get_data_by_kind(DatasetKind.TRAIN).classes_indices.keys()
-        classes_only_in_test_count = {key: value for key, value in test_data.n_of_samples_per_class.items()
+        test_samples_per_class = test_data._samples_per_class_view  # pylint: disable=protected-access
+        classes_only_in_test_count = {key: value for key, value in test_samples_per_class.items()
                                       if key not in classes_in_train}
         # sort by number of appearances in test set in descending order
         classes_only_in_test_count = dict(sorted(classes_only_in_test_count.items(), key=lambda item: -item[1]))
 
         result_value = {
             'new_labels': {test_data.label_id_to_name(key): value for key, value in classes_only_in_test_count.items()},
-            'all_labels_count': sum(test_data.n_of_samples_per_class.values())
+            'all_labels_count': sum(test_samples_per_class.values())
         }
 
         if context.with_display:
@@ -111,7 +111,7 @@ class Context:
                                                           [train_predictions, test_predictions]):
                 if dataset is not None:
                     try:
-                        preds = itemgetter(*list(dataset.data_loader.batch_sampler)[0])(predictions)
+                        preds = itemgetter(*next(iter(dataset.data_loader.batch_sampler)))(predictions)
                         if dataset.task_type == TaskType.CLASSIFICATION:
                             preds = torch.stack(preds)
                         dataset.validate_inferred_batch_predictions(preds)
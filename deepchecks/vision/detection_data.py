@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Module containing the DetectionData class and its functions."""
+import itertools
 from abc import abstractmethod
 from typing import List, Sequence
 
@@ -118,11 +119,12 @@ class DetectionData(VisionData):
 
     def get_classes(self, batch_labels: List[torch.Tensor]):
         """Get a labels batch and return classes inside it."""
-
-        def get_classes_from_single_label(tensor: torch.Tensor):
-            return list(tensor[:, 0].type(torch.IntTensor).tolist()) if len(tensor) > 0 else []
-
-        return [get_classes_from_single_label(x) for x in batch_labels]
+        # Convert the classes of all the bboxes in the batch at once, and then split them back by sample
+        bboxes_per_sample = [len(x) for x in batch_labels]
+        if not any(bboxes_per_sample):
+            return [[] for _ in bboxes_per_sample]
+        classes = iter(torch.cat([x[:, 0] for x in batch_labels if len(x) > 0]).type(torch.IntTensor).tolist())
+        return [list(itertools.islice(classes, n_bboxes)) for n_bboxes in bboxes_per_sample]
 
     def validate_label(self, batch):
         """
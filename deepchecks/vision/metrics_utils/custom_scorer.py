@@ -75,11 +75,11 @@ class CustomClassificationScorer(Metric):
         if isinstance(y_proba, torch.Tensor):
             y_proba = y_proba.cpu().detach().numpy()
         else:
-            y_proba = np.array(y_proba)
+            y_proba = np.asarray(y_proba)
         if isinstance(y, torch.Tensor):
             y = y.cpu().detach().numpy()
         else:
-            y = np.array(y)
+            y = np.asarray(y)
 
         self._y_proba.append(y_proba)
         self._y.append(y)
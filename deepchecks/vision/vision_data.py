@@ -10,11 +10,13 @@
 #
 """Module containing the VisionData class and its functions."""
 # pylint: disable=protected-access
+import itertools
 import random
 from abc import abstractmethod
 from collections import defaultdict
 from copy import copy
-from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Type, TypeVar, Union
 
 import numpy as np
 import torch
@@ -33,6 +35,11 @@ __all__ = ['VisionData', 'IndicesSequentialSampler']
 
 VD = TypeVar('VD', bound='VisionData')
 
+# DataLoader attributes which are passed on to the copies of a data loader (those missing in older torch are skipped)
+# The generator is not shared, so iterating a copy doesn't advance the random state of the user's data loader
+_COPYABLE_LOADER_ATTRS = ('num_workers', 'collate_fn', 'pin_memory', 'timeout', 'worker_init_fn', 'prefetch_factor',
+                          'persistent_workers', 'multiprocessing_context')
+
 
 class VisionData:
     """VisionData represent a base task in deepchecks. It wraps PyTorch DataLoader together with model related metadata.
@@ -54,6 +61,12 @@ class VisionData:
         Name of the dataset to use in the displays instead of "Train" or "Test".
     """
 
+    # Whether copied data loaders (such as the sampled data loaders used by the checks) which use worker processes
+    # should keep their workers alive and pin memory when cuda is available. The copied loaders are iterated by each
+    # check, so this saves re-spawning the workers on every iteration. Set to False if pinned memory is an issue
+    # (pinned memory is not swappable and is kept for as long as the workers live).
+    FAST_COPY_LOADER: bool = True
+
     def __init__(
         self,
         data_loader: DataLoader,
@@ -62,6 +75,9 @@ class VisionData:
         transform_field: Optional[str] = 'transforms',
         dataset_name: Optional[str] = None
     ):
+        if not (isinstance(dataset_name, str) or (dataset_name is None)):
+            raise DeepchecksValueError('The dataset_name parameter accepts a string or None.')
+
         # Create data loader that uses IndicesSequentialSampler, which always return batches in the same order
         self._data_loader, self._sampler = self._get_data_loader_sequential(data_loader)
 
@@ -71,6 +87,7 @@ class VisionData:
         self._image_formatter_error = None
         self._label_formatter_error = None
         self._get_classes_error = None
+        self._probe_batch = None
         self.name = dataset_name
 
         batch = next(iter(self._data_loader))
@@ -111,13 +128,9 @@ class VisionData:
             get_logger().warning(self._get_classes_error)
 
         self._classes_indices = None
+        self._samples_per_class = None
         self._current_index = None
 
-        if isinstance(dataset_name, str) or (dataset_name is None):
-            self.name = dataset_name
-        else:
-            raise DeepchecksValueError('The dataset_name parameter accepts a string or None.')
-
     @classmethod
     def from_dataset(
         cls: Type[VD],
@@ -270,17 +283,25 @@ class VisionData:
             classes_per_label = self.get_classes(batch.labels)
         except DeepchecksBaseError:
             self._classes_indices = None
+            self._samples_per_class = None
             return
-
-        for batch_index, classes in enumerate(classes_per_label):
+        self._update_classes_indices(classes_per_label)
+
+    def _update_classes_indices(self, classes_per_label: List[List[int]]):
+        """Add the classes of the next samples in the data loader order to the classes' metadata info."""
+        # Resolve the dataset indices of the whole batch with a single slice of the sampler indices
+        batch_end_index = self._current_index + len(classes_per_label)
+        dataset_indices = self._sampler.indices[self._current_index:batch_end_index]
+        for dataset_index, classes in zip(dataset_indices, classes_per_label):
             for single_class in classes:
-                dataset_index = self.to_dataset_index(self._current_index + batch_index)[0]
                 self._classes_indices[single_class].append(dataset_index)
-        self._current_index += len(classes_per_label)
+        self._current_index = batch_end_index
+        self._samples_per_class = None
 
     def init_cache(self):
         """Initialize the cache of the classes' metadata info."""
         self._classes_indices = defaultdict(list)
+        self._samples_per_class = None
         self._current_index = 0
 
     @property
@@ -296,7 +317,14 @@ class VisionData:
     @property
     def n_of_samples_per_class(self) -> Dict[Any, int]:
         """Return a dictionary containing the number of samples per class."""
-        return {k: len(v) for k, v in self.classes_indices.items()}
+        return dict(self._samples_per_class_view)
+
+    @property
+    def _samples_per_class_view(self) -> Mapping[Any, int]:
+        """Return a read-only view of the number of samples per class, which is computed once per cache."""
+        if self._samples_per_class is None:
+            self._samples_per_class = {k: len(v) for k, v in self.classes_indices.items()}
+        return MappingProxyType(self._samples_per_class)
 
     @property
     def data_loader(self) -> DataLoader:
@@ -343,7 +371,7 @@ class VisionData:
     @property
     def data_dimension(self):
         """Return how many dimensions the image data have."""
-        image = self.batch_to_images(next(iter(self)))[0]  # pylint: disable=not-callable
+        image = self.batch_to_images(self._get_probe_batch())[0]  # pylint: disable=not-callable
         return ImageInfo(image).get_dimension()
 
     def label_id_to_name(self, class_id: int) -> str:
@@ -374,16 +402,20 @@ class VisionData:
     def get_augmented_dataset(self, aug) -> VD:
         """Return a copy of the vision data object with the augmentation in the start of it."""
         transform_handler = self.get_transform_type()
-        new_vision_data = self.copy()
+        # The transforms of the new dataset are altered, so it must not share the dataset with this object
+        new_vision_data = self.copy(share_dataset=False)
         new_dataset_ref = new_vision_data.data_loader.dataset
         transform = new_dataset_ref.__getattribute__(self._transform_field)
         new_transform = transform_handler.add_augmentation_in_start(aug, transform)
         new_dataset_ref.__setattr__(self._transform_field, new_transform)
         return new_vision_data
 
-    def copy(self, n_samples: int = None, shuffle: bool = False, random_state: int = None) -> VD:
-        """Create new copy of this object, with the data-loader and dataset also copied, and altered by the given \
-        parameters.
+    def copy(self, n_samples: int = None, shuffle: bool = False, random_state: int = None,
+             share_dataset: bool = True) -> VD:
+        """Create new copy of this object, with the data-loader also copied, and altered by the given parameters.
+
+        .. versionchanged:: 0.10
+            The copied data-loader uses the same Dataset object as this one, unless share_dataset is False.
 
         Parameters
         ----------
@@ -395,20 +427,33 @@ class VisionData:
             consistent order)
         random_state : int , default: None
             random_state used for the psuedo-random actions (sampling and shuffling)
+        share_dataset : bool, default: True
+            Whether the copied DataLoader uses the same Dataset object as this one. Set to False in order to alter the
+            Dataset of the copy (for example its transforms) without affecting this object.
         """
         new_vision_data = copy(self)
         copied_data_loader, copied_sampler = self._get_data_loader_copy(
-            self.data_loader, shuffle=shuffle, random_state=random_state, n_samples=n_samples
+            self.data_loader, shuffle=shuffle, random_state=random_state, n_samples=n_samples,
+            copy_dataset=not share_dataset
         )
         new_vision_data._data_loader = copied_data_loader
         new_vision_data._sampler = copied_sampler
+        new_vision_data._probe_batch = None
         # If new data is sampled, then needs to re-calculate cache
         if n_samples and self._classes_indices is not None:
             new_vision_data.init_cache()
+            # The samples are loaded and transformed by the data loader (in its workers, if it has any), so the main
+            # process only extracts the classes and adds them to the cache
             for batch in new_vision_data:
-                new_vision_data.update_cache(self.batch_to_labels(batch))
+                new_vision_data._update_classes_indices(self.get_classes(self.batch_to_labels(batch)))
         return new_vision_data
 
+    def _get_probe_batch(self):
+        """Return a cached batch of the first sample, used to query metadata without iterating the data loader."""
+        if self._probe_batch is None:
+            self._probe_batch = self.batch_of_index(0)
+        return self._probe_batch
+
     def to_batch(self, *samples):
         """Use the defined collate_fn to transform a few data items to batch format."""
         return self._data_loader.collate_fn(list(samples))
@@ -546,7 +591,7 @@ class VisionData:
 
     @staticmethod
     def _get_data_loader_copy(data_loader: DataLoader, n_samples: int = None, shuffle: bool = False,
-                              random_state: int = None):
+                              random_state: int = None, copy_dataset: bool = True):
         """Get a copy of DataLoader which is already using IndicesSequentialSampler, altered by the given parameters.
 
         Parameters
@@ -561,6 +606,8 @@ class VisionData:
             consistent order)
         random_state : int , default: None
             random_state used for the psuedo-random actions (sampling and shuffling)
+        copy_dataset : bool, default: True
+            Whether to use a shallow copy of the Dataset in the copied DataLoader, or the same Dataset object.
         """
         # Get sampler and copy it indices if it's already IndicesSequentialSampler
         batch_sampler = data_loader.batch_sampler
@@ -570,39 +617,33 @@ class VisionData:
             raise DeepchecksValueError('Expected data loader with sampler of type IndicesSequentialSampler')
         # If got number of samples which is smaller than the number of samples we currently have,
         # then take random sample
+        # A seeded generator instance gives the same samples as seeding the global one, without altering the global
+        # random state of the user
         if n_samples and n_samples < len(batch_sampler.sampler):
             size = min(n_samples, len(indices))
-            if random_state is not None:
-                random.seed(random_state)
-            indices = random.sample(indices, size)
+            rng = random.Random(random_state) if random_state is not None else random
+            indices = rng.sample(indices, size)
         # Shuffle indices if need
         if shuffle:
-            if random_state is not None:
-                random.seed(random_state)
-            indices = random.sample(indices, len(indices))
+            rng = random.Random(random_state) if random_state is not None else random
+            indices = rng.sample(indices, len(indices))
         # Create new sampler and batch sampler
         sampler = IndicesSequentialSampler(indices)
         new_batch_sampler = BatchSampler(sampler, batch_sampler.batch_size, batch_sampler.drop_last)
 
-        props = VisionData._get_data_loader_props(data_loader)
+        props = VisionData._get_data_loader_props(data_loader, copy_dataset=copy_dataset)
         props['batch_sampler'] = new_batch_sampler
+        if VisionData.FAST_COPY_LOADER and torch.cuda.is_available() and data_loader.num_workers > 0:
+            props['persistent_workers'] = True
+            props['pin_memory'] = True
         return data_loader.__class__(**props), sampler
 
     @staticmethod
-    def _get_data_loader_props(data_loader: DataLoader):
+    def _get_data_loader_props(data_loader: DataLoader, copy_dataset: bool = True):
         """Get properties relevant for the copy of a DataLoader."""
-        attr_list = ['num_workers',
-                     'collate_fn',
-                     'pin_memory',
-                     'timeout',
-                     'worker_init_fn',
-                     'prefetch_factor',
-                     'persistent_workers']
-        aval_attr = {}
-        for attr in attr_list:
-            if hasattr(data_loader, attr):
-                aval_attr[attr] = getattr(data_loader, attr)
-        aval_attr['dataset'] = copy(data_loader.dataset)
+        aval_attr = {attr: getattr(data_loader, attr) for attr in _COPYABLE_LOADER_ATTRS
+                     if hasattr(data_loader, attr)}
+        aval_attr['dataset'] = copy(data_loader.dataset) if copy_dataset else data_loader.dataset
         return aval_attr
 
     @staticmethod
@@ -612,11 +653,9 @@ class VisionData:
         # First set generator seed to make it reproducible
         if data_loader.generator:
             data_loader.generator.set_state(torch.Generator().manual_seed(42).get_state())
-        indices = []
         batch_sampler = data_loader.batch_sampler
-        # Using the batch sampler to get all indices
-        for batch in batch_sampler:
-            indices += batch
+        # Using the batch sampler to get all indices, drained into a single list without extending it batch by batch
+        indices = list(itertools.chain.from_iterable(batch_sampler))
 
         # Create new sampler and batch sampler
         sampler = IndicesSequentialSampler(indices)
@@ -638,7 +677,8 @@ class IndicesSequentialSampler(Sampler):
 
     def __init__(self, indices: List[int]) -> None:
         super().__init__(None)
-        self.indices = indices
+        # Convert numpy indices once in bulk, so iterating them yields python ints without boxing each numpy scalar
+        self.indices = indices.tolist() if isinstance(indices, np.ndarray) else indices
 
     def __iter__(self) -> Iterator[int]:
         """Return an iterator over the indices."""
@@ -648,6 +688,10 @@ class IndicesSequentialSampler(Sampler):
         """Return the number of indices."""
         return len(self.indices)
 
+    def __getitem__(self, location):
+        """Return the index value at the given location, or a list of index values for a slice of locations."""
+        return self.indices[location]
+
     def index_at(self, location):
         """Return for a given location, the real index value."""
         return self.indices[location]
@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------------
 #
 """Test metrics utils"""
+import numpy as np
 import pandas as pd
 from hamcrest import assert_that, close_to, calling, raises, has_entries, is_
 from sklearn.metrics import make_scorer
@@ -21,6 +22,7 @@ from deepchecks.tabular.metric_utils.additional_classification_metrics import (f
                                                                                false_positive_rate_metric,
                                                                                true_negative_rate_metric)
 from deepchecks.tabular.utils.task_inference import infer_classes_from_model, get_all_labels
+from deepchecks.utils.metrics import get_gain, get_gains
 
 
 def deepchecks_scorer(scorer, clf, dataset):
@@ -191,3 +193,31 @@ def test_scorer_with_only_new_labels_in_data(iris: pd.DataFrame, iris_adaboost):
     assert_that(score, has_entries({
         0: is_(0), 1: is_(0), 2: is_(0), 19: is_nan(), 20: is_nan()
     }))
+
+
+def test_get_gains_matches_get_gain():
+    # Arrange
+    base_scores = np.array([0.5, 1, 1, 0.2, 0.9, 0.5])
+    scores = np.array([0.75, 1, 0.8, 0.1, 0.95, -10])
+    perfect_scores = np.array([1, 1, 1, 1, 1, 1])
+
+    # Act
+    gains = get_gains(base_scores, scores, perfect_scores, max_gain=2)
+
+    # Assert
+    for gain, base_score, score, perfect_score in zip(gains, base_scores, scores, perfect_scores):
+        assert_that(gain, close_to(get_gain(base_score, score, perfect_score, max_gain=2), 1e-9))
+
+
+def test_get_gains_matches_get_gain_for_integer_scores():
+    # Arrange
+    base_scores = np.array([0, 1, 1, 0])
+    scores = np.array([1, 1, 0, 0])
+    perfect_scores = np.array([1, 1, 1, 2])
+
+    # Act
+    gains = get_gains(base_scores, scores, perfect_scores, max_gain=50)
+
+    # Assert
+    for gain, base_score, score, perfect_score in zip(gains, base_scores, scores, perfect_scores):
+        assert_that(gain, close_to(get_gain(base_score, score, perfect_score, max_gain=50), 1e-9))
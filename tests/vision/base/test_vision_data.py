@@ -11,11 +11,13 @@
 #
 import itertools
 import typing as t
+from unittest.mock import patch
 
 import albumentations as A
 import imgaug.augmenters as iaa
 import torch
-from hamcrest import all_of, assert_that, calling, contains_exactly, equal_to, has_entries, instance_of, raises
+from hamcrest import (all_of, assert_that, calling, contains_exactly, equal_to, has_entries, instance_of, is_not,
+                      raises, same_instance)
 from torch.utils.data import DataLoader
 
 from deepchecks.core.errors import DeepchecksNotImplementedError, DeepchecksValueError, ValidationError
@@ -28,7 +30,7 @@ from deepchecks.vision.datasets.detection.coco import COCOData
 from deepchecks.vision.datasets.segmentation import segmentation_coco
 from deepchecks.vision.detection_data import DetectionData
 from deepchecks.vision.utils.transformations import AlbumentationsTransformations, ImgaugTransformations
-from deepchecks.vision.vision_data import TaskType, VisionData
+from deepchecks.vision.vision_data import IndicesSequentialSampler, TaskType, VisionData
 from tests.vision.vision_conftest import run_update_loop
 
 
@@ -141,6 +143,24 @@ def test_vision_data_n_of_samples_per_class_inference_for_detection_dataset():
     )
 
 
+def test_vision_data_n_of_samples_per_class_of_sampled_copy():
+    # Arrange
+    loader = t.cast(DataLoader, mnist.load_dataset(train=True, object_type="DataLoader"))
+    dataset = SimpleClassificationData(loader)
+    run_update_loop(dataset)
+
+    # Act
+    sampled = dataset.copy(n_samples=100, random_state=0)
+
+    # Assert
+    real_n_of_samples = {}
+    for _, labels in sampled:
+        for y in labels.tolist():
+            real_n_of_samples[y] = 1 + real_n_of_samples.get(y, 0)
+    assert_that(sampled.n_of_samples_per_class, equal_to(real_n_of_samples))
+    assert_that(sum(sampled.n_of_samples_per_class.values()), equal_to(100))
+
+
 def test_vision_data_label_comparison_with_different_datasets():
     # Arrange
     coco_dataset = t.cast(COCOData, coco.load_dataset(train=True, object_type='VisionData'))
@@ -231,6 +251,29 @@ def test_add_augmentation_albumentations(mnist_dataset_train: VisionData):
     assert_that(data_sample.numpy().shape, equal_to((1, 1, 1)))
 
 
+def test_add_augmentation_does_not_alter_original_dataset(mnist_dataset_train: VisionData):
+    # Arrange
+    original_dataset = mnist_dataset_train.data_loader.dataset
+    original_transform = original_dataset.transform
+    original_shape = next(iter(mnist_dataset_train.data_loader))[0][0].shape
+    augmentation = A.CenterCrop(1, 1)
+    # Act
+    copy_dataset = mnist_dataset_train.get_augmented_dataset(augmentation)
+    # Assert
+    assert_that(copy_dataset.data_loader.dataset, is_not(same_instance(original_dataset)))
+    assert_that(original_dataset.transform, same_instance(original_transform))
+    assert_that(next(iter(mnist_dataset_train.data_loader))[0][0].shape, equal_to(original_shape))
+
+
+def test_copy_shares_dataset(mnist_dataset_train: VisionData):
+    # Act
+    shared_copy = mnist_dataset_train.copy()
+    separate_copy = mnist_dataset_train.copy(share_dataset=False)
+    # Assert
+    assert_that(shared_copy.data_loader.dataset, same_instance(mnist_dataset_train.data_loader.dataset))
+    assert_that(separate_copy.data_loader.dataset, is_not(same_instance(mnist_dataset_train.data_loader.dataset)))
+
+
 def test_add_augmentation_albumentations_wrong_type(mnist_dataset_train):
     # Arrange
     copy_dataset = mnist_dataset_train.copy()
@@ -302,6 +345,26 @@ def test_sampler(mnist_dataset_train):
     assert_that(sampled.is_sampled(), equal_to(True))
 
 
+def test_copy_fast_copy_loader(mnist_data_loader_train):
+    # Arrange
+    loader = DataLoader(mnist_data_loader_train.dataset, batch_size=64, num_workers=2)
+    data = MNISTData(loader, transform_field='transform')
+
+    # Act
+    with patch('torch.cuda.is_available', return_value=True):
+        copied = data.copy()
+    # Assert
+    assert_that(copied.data_loader.persistent_workers, equal_to(True))
+    assert_that(copied.data_loader.pin_memory, equal_to(True))
+
+    # Act
+    with patch('torch.cuda.is_available', return_value=True), patch.object(VisionData, 'FAST_COPY_LOADER', False):
+        copied = data.copy()
+    # Assert
+    assert_that(copied.data_loader.persistent_workers, equal_to(False))
+    assert_that(copied.data_loader.pin_memory, equal_to(False))
+
+
 def test_data_at_batch_index_to_dataset_index(mnist_dataset_train):
     # Arrange
     sample_index = 100
@@ -325,6 +388,16 @@ def test_data_at_batch_index_to_dataset_index(mnist_dataset_train):
     assert sample[1][0] == single_label
 
 
+def test_indices_sequential_sampler_indexing():
+    # Arrange
+    sampler = IndicesSequentialSampler([5, 3, 8, 1])
+    # Act & Assert
+    assert_that(sampler[1], equal_to(3))
+    assert_that(sampler[1:3], contains_exactly(3, 8))
+    assert_that(sampler.index_at(3), equal_to(1))
+    assert_that(list(sampler), contains_exactly(5, 3, 8, 1))
+
+
 def test_get_classes_validation_not_sequence(mnist_data_loader_train):
     # Arrange
     class TestData(MNISTData):
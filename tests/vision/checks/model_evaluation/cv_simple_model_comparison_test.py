@@ -138,3 +138,16 @@ def test_condition_pass_for_multiclass_avg_with_classes(mnist_dataset_train, mni
             details='Found metrics with gain below threshold: {\'F1\': \'98.63%\'}'
         )
     ))
+
+
+def test_default_scorer_perfect_model_scores(mnist_dataset_train, mnist_dataset_test, mock_trained_mnist, device):
+    # Arrange
+    check = SimpleModelComparison()
+    # Act
+    result = check.run(mnist_dataset_train, mnist_dataset_test, mock_trained_mnist, device=device)
+    perfect_rows = result.value.loc[result.value['Model'] == 'Perfect Model']
+    given_rows = result.value.loc[result.value['Model'] == 'Given Model']
+    # Assert
+    assert_that(sorted(perfect_rows['Class']), equal_to(sorted(given_rows['Class'])))
+    for value in perfect_rows['Value']:
+        assert_that(value, close_to(1, 1e-6))